@@ -27,19 +27,19 @@ author = 'WizzyGeek'
 
 # The full version, including alpha/beta/rc tags
 
+def _read_version() -> str:
+    try:
+        import tomllib
+    except ModuleNotFoundError: # python < 3.11
+        import tomli as tomllib
+
+    with (Path(__file__).parents[2] / "pyproject.toml").open("rb") as f:
+        return tomllib.load(f)["tool"]["poetry"]["version"]
+
 try:
     from uprate import __version__ as release
 except (ModuleNotFoundError, ImportError):
-    release = None
-
-    with (Path(__file__).parents[2] / "pyproject.toml").open("r") as f:
-        for i in f.readlines():
-            if "version" in i:
-                release = i.split("=")[1].strip('" \n')
-                break
-
-if release is None: # fail early
-    raise RuntimeError("Could not get uprate's version")
+    release = _read_version()
 
 
 # -- General configuration ---------------------------------------------------
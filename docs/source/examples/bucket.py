@@ -8,7 +8,7 @@ async def worker(id: int, bucket: up.Bucket[str]):
         print("hello from ", id)
 
 async def main():
-    # Bucket uses a queue so during creation a running loop must be present.
+    # Bucket uses a semaphore so during creation a running loop must be present.
     bucket = up.Bucket[str](2 / up.Seconds(1), concurrency=2)
     await asyncio.gather(*(asyncio.create_task(worker(i, bucket)) for i in range(5)))
 
@@ -1,11 +1,45 @@
+from . import _sync, decorators, errors, rate, store
+from . import ratelimit as _ratelimit # shadowed by the decorator below
 from .rate import *
 from .ratelimit import *
 from .decorators import *
 from .store import *
 from ._sync import *
 from .errors import *
-from .bucket import *
+from ._version import __version__
 
-from importlib.metadata import version
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__version__ = version("uprate")
+if TYPE_CHECKING:
+    from .bucket import *
+
+# Built from the submodules so the two can't drift apart. Bucket isn't
+# a global until first accessed, so star imports need it listed explicitly.
+__all__ = (
+    *rate.__all__,
+    *_ratelimit.__all__,
+    *decorators.__all__,
+    *store.__all__,
+    *_sync.__all__,
+    *errors.__all__,
+    "Bucket"
+)
+
+# .bucket is loaded lazily, as it pulls in asyncio which
+# sync-only users shouldn't have to pay for at import.
+def __getattr__(name: str) -> Any:
+    if name == "Bucket":
+        from .bucket import Bucket
+
+        globals()[name] = Bucket
+        return Bucket
+
+    if name == "bucket":
+        # Importing a submodule binds it on the package.
+        return import_module(".bucket", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), "Bucket", "bucket"})
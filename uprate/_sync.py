@@ -5,15 +5,17 @@
 # with type checkers
 from __future__ import annotations
 
-from abc import abstractmethod
+from abc import ABC, abstractmethod
 from operator import attrgetter
-from time import monotonic as _now, time as unix
-from typing import (TYPE_CHECKING, Callable, Generic, Protocol, TypeVar, cast,
-                    runtime_checkable)
+from time import time as unix
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from .errors import RateLimitError
 from .rate import Rate, RateGroup
-from .store import H, MemoryStore, T
+from .store import H, T, _MemoryRecords
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 __all__ = (
     "SyncStore",
@@ -23,11 +25,18 @@ __all__ = (
 
 G = TypeVar("G")
 
-if TYPE_CHECKING:
-    from .rate import Rate, RateGroup
+class SyncStore(ABC, Generic[T]):
+    """An abstract base class defining the design of sync stores.
+    Sync version of :class:`uprate.store.BaseStore`
+
+    Stores must inherit from this class, or be registered
+    as a virtual subclass with :meth:`~abc.ABCMeta.register`.
 
-@runtime_checkable
-class SyncStore(Protocol[T]):
+    Attributes
+    ----------
+    limit : :class:`.SyncRateLimit`
+        The SyncRateLimit to which this store is bound to.
+    """
     limit: SyncRateLimit
 
     def setup(self, ratelimit: SyncRateLimit):
@@ -39,6 +48,11 @@ class SyncStore(Protocol[T]):
         """Sync version of :meth:`uprate.store.BaseStore.acquire`"""
         ...
 
+    def acquire_many(self, keys: Iterable[T]) -> list[tuple[bool, float, Rate | None]]:
+        """Sync version of :meth:`uprate.store.BaseStore.acquire_many`"""
+        acquire = self.acquire
+        return [acquire(key) for key in keys]
+
     @abstractmethod
     def reset(self, key: T) -> None:
         """Sync version of :meth:`uprate.store.BaseStore.reset`"""
@@ -49,11 +63,11 @@ class SyncStore(Protocol[T]):
         """Sync version of :meth:`uprate.store.BaseStore.clear`"""
         ...
 
-class SyncMemoryStore(SyncStore[H]):
-    """An implementation of :class:`.SyncStore` protocol,
+class SyncMemoryStore(_MemoryRecords[H], SyncStore[H]):
+    """An implementation of :class:`.SyncStore`,
     hence is also the sync version of :class:`~uprate.store.MemoryStore`
 
-    This implementation uses :class:`dict` and ejects stale buckets/keys
+    This implementation uses :class:`~collections.OrderedDict` and ejects stale buckets/keys
     periodically only when :meth:`.SyncMemoryStore.acquire` is called.
 
     This is a generic in TypeVar :data:`.H`
@@ -63,42 +77,16 @@ class SyncMemoryStore(SyncStore[H]):
     limit : :class:`uprate.ratelimit.RateLimit`
         The RateLimit to which this store is bound to.
     """
-    _data: dict[H, tuple[list[int | float], ...]]
-
-    def __init__(self):
-        self._data = {}
-        self._last_verified = 0.0
-
     def setup(self, ratelimit: SyncRateLimit):
         super().setup(ratelimit)
-        self._max_period = self.limit.rates[-1].period
+        self._setup_records(self.limit.rates)
+        # acquire would only forward the call, skip it
+        # unless a subclass has overridden it.
+        if type(self).acquire is SyncMemoryStore.acquire:
+            self.acquire = self._acquire_sync # type: ignore[assignment]
 
     def acquire(self, key: H) -> tuple[bool, float, Rate | None]:
-        now = _now()
-        self.verify_cache() # Evict stale keys
-        record = self._data.get(key, None)
-
-        if record is None:
-            # 1st insert
-            self._data[key] = tuple([i.uses - 1, now] for i in self.limit.rates)
-            return True, 0.0, None
-        else:
-            worst: float = False
-            worst_rate: Rate | None = None
-
-            for use_dt, rate in zip(record, self.limit.rates):
-                if use_dt[0] == 0:
-                    if (then := (use_dt[1] + rate.period)) <= now:
-                        use_dt[:] = [rate.uses - 1, now]
-                    elif (retry := then - now) > worst:
-                        worst = retry
-                        worst_rate = rate
-                else:
-                    use_dt[0] -= 1
-            if worst is False:
-                return True, 0.0, None
-
-            return False, worst, worst_rate
+        return self._acquire_sync(key)
 
     def reset(self, key: H) -> None:
         del self._data[key]
@@ -106,8 +94,6 @@ class SyncMemoryStore(SyncStore[H]):
     def clear(self) -> None:
         self._data.clear()
 
-    verify_cache = cast(Callable[[SyncStore[H]], None], MemoryStore.verify_cache)
-
 class SyncRateLimit(Generic[G]):
     """Enforces multiple rates per provided keys.
     This is a low-level sync component.
@@ -161,9 +147,17 @@ class SyncRateLimit(Generic[G]):
 
         if not res:
             # <../ratelimit.py#82>
-            raise RateLimitError(retry_at=retry + unix(), rate=rate) # type: ignore[arg-type]
+            raise RateLimitError(retry + unix(), rate, retry_after=retry) # type: ignore[arg-type]
+
+    def try_acquire(self, key: G) -> tuple[bool, float, Rate | None]:
+        """Sync version of :meth:`uprate.ratelimit.RateLimit.try_acquire`"""
+        return self.store.acquire(key)
+
+    def try_acquire_many(self, keys: Iterable[G]) -> list[tuple[bool, float, Rate | None]]:
+        """Sync version of :meth:`uprate.ratelimit.RateLimit.try_acquire_many`"""
+        return self.store.acquire_many(keys)
 
-    def reset(self, key: G = None) -> None:
+    def reset(self, key: G | None = None) -> None:
         if key is None:
             self.store.clear()
         else:
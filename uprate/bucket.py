@@ -3,7 +3,6 @@ from __future__ import annotations
 import asyncio
 from typing import TYPE_CHECKING, Generic, Literal, TypeVar
 
-from .errors import RateLimitError
 from .ratelimit import RateLimit
 
 if TYPE_CHECKING:
@@ -19,6 +18,8 @@ __all__ = (
 T = TypeVar("T")
 
 class BucketCM(Generic[T]):
+    __slots__ = ("key", "bucket")
+
     key: T
     bucket: Bucket[T]
 
@@ -27,8 +28,8 @@ class BucketCM(Generic[T]):
         self.key = key
 
     async def __aenter__(self):
-        if self.bucket._queue:
-            await self.bucket._queue.get()
+        if self.bucket._sem:
+            await self.bucket._sem.acquire()
 
         await self.__wait()
         return None
@@ -37,20 +38,22 @@ class BucketCM(Generic[T]):
                         exc_type: type[BaseException] | None,
                         exc: BaseException | None,
                         tb: TracebackType | None) -> Literal[False]:
-        if self.bucket._queue:
-            self.bucket._queue.put_nowait(None)
+        if self.bucket._sem:
+            self.bucket._sem.release()
 
         return False
 
     async def __wait(self) -> None:
+        # Failing to acquire is expected here,
+        # so avoid raising and catching errors.
+        limit = self.bucket._limit
         while True:
-            try:
-                await self.bucket._limit.acquire(self.key)
-            except RateLimitError as err:
-                await asyncio.sleep(float(err))
-            else:
+            res, retry, _ = await limit.try_acquire(self.key)
+            if res:
                 return None
 
+            await asyncio.sleep(retry)
+
 class Bucket(Generic[T]):
     """A high level ratelimit construct to obey both
     ratelimits and concurrency.
@@ -74,18 +77,15 @@ class Bucket(Generic[T]):
     """
 
     _limit: RateLimit[T]
-    _queue: asyncio.Queue | None
+    _sem: asyncio.Semaphore | None
 
     def __init__(self, rate: Rate | RateGroup, store: BaseStore[T] = None, concurrency: int = 0) -> None:
         self._limit = RateLimit(rate, store)
 
         if concurrency > 0:
-            self._queue = asyncio.Queue(maxsize=concurrency)
-
-            for _ in range(concurrency):
-                self._queue.put_nowait(None)
+            self._sem = asyncio.Semaphore(concurrency)
         else:
-            self._queue = None
+            self._sem = None
 
     @classmethod
     def from_limit(cls, limit: RateLimit[T]) -> Bucket[T]:
@@ -135,7 +135,7 @@ class Bucket(Generic[T]):
         """
         return BucketCM(self, key)
 
-    async def reset(self, key: T = None) -> None:
+    async def reset(self, key: T | None = None) -> None:
         """Reset the given key.
 
         Parameters
@@ -143,7 +143,7 @@ class Bucket(Generic[T]):
         key : :data:`.T`, :data:`None`, (``T | None``)
             The key to reset ratelimit for. If :data:`None`, then resets all ratelimits, by default :data:`None`.
         """
-        self._limit.reset()
+        await self._limit.reset(key)
 
     @property
     def rates(self) -> tuple[Rate, ...]:
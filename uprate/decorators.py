@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from asyncio import iscoroutinefunction, sleep
 from collections.abc import Coroutine
 from functools import wraps
-from time import sleep as block
-from typing import TYPE_CHECKING, Any, Callable, Protocol, TypeVar, Union, cast
+from inspect import iscoroutinefunction
+from time import sleep as block, time as unix
+from typing import (TYPE_CHECKING, Any, Callable, Optional, Protocol, TypeVar,
+                    Union, cast)
 
 from ._sync import SyncRateLimit, SyncStore
-from ._utils import maybe_awaitable
 from .errors import RateLimitError
 from .ratelimit import RateLimit
 from .store import BaseStore
@@ -28,19 +28,12 @@ R = TypeVar("R", covariant=True)
 
 AnyRateLimit = Union[SyncRateLimit, RateLimit]
 
-class LimitedCallable(Protocol[R]):
-    limit: AnyRateLimit
-
-    def __call__(self, *args, **kwds) -> R:
-        ...
-
-def _apply_attrs(func: Callable[..., R], **attrs) -> LimitedCallable[R]:
-    func = cast(LimitedCallable[R], func)
-
-    for k, v in attrs.items():
-        setattr(func, k, v)
+if TYPE_CHECKING:
+    class LimitedCallable(Protocol[R]):
+        limit: AnyRateLimit
 
-    return func
+        def __call__(self, *args, **kwds) -> R:
+            ...
 
 async def on_retry_sleep(error: RateLimitError) -> None:
     """Make the current task yield to the event_loop
@@ -52,6 +45,10 @@ async def on_retry_sleep(error: RateLimitError) -> None:
     error : :exc:`.RateLimitError`
         The rate limit error to sleep for.
     """
+    # asyncio is imported here so that importing uprate doesn't
+    # import asyncio, it will already be loaded by the time this is awaited.
+    from asyncio import sleep
+
     await sleep(error.retry_after)
 
 def on_retry_block(error: RateLimitError) -> None:
@@ -66,6 +63,16 @@ def on_retry_block(error: RateLimitError) -> None:
     """
     block(error.retry_after)
 
+# Used in place of on_retry_sleep and on_retry_block by ratelimit,
+# which already has the retry time and doesn't need to build an error.
+async def _sleep_for(retry: float, violated: Rate) -> None:
+    from asyncio import sleep
+
+    await sleep(retry)
+
+def _block_for(retry: float, violated: Rate) -> None:
+    block(retry)
+
 # TODO: Complete Docs
 def ratelimit(
     rate: Rate | RateGroup, *,
@@ -98,51 +105,174 @@ def ratelimit(
     ------
     :exc:`.RateLimitError`
         ``on_retry`` parameter is not provided and the decorated function got ratelimited.
+    :exc:`TypeError`
+        ``store`` is neither a :class:`.BaseStore` nor a :class:`.SyncStore`.
     """
+    # The store doesn't change between decorated functions,
+    # so it is validated once here.
+    if store is None:
+        async_store = sync_store = True
+    elif isinstance(store, BaseStore):
+        async_store, sync_store = True, False
+    elif isinstance(store, SyncStore):
+        async_store, sync_store = False, True
+    else:
+        raise TypeError("Expected a type deriving from uprate.store.BaseStore or uprate._sync.SyncStore instead got " + str(type(store)))
+
     def decorator(func: Callable[..., R]) -> LimitedCallable[R]:
-        nonlocal on_retry, key
-        key = key or cast(Callable[..., Key], lambda *a, **k: "DEFAULT_BUCKET_" + func.__name__)
+        # Without a key callback every call uses the same bucket,
+        # so it is built once and the callback is skipped.
+        bucket = "DEFAULT_BUCKET_" + func.__name__
 
+        # The wrapper is picked here once, so that the call path
+        # doesn't have to branch on how it was configured.
+        # Wrappers that retry use try_acquire, as getting ratelimited is
+        # expected there and raising to catch right away is expensive.
         if iscoroutinefunction(func):
-            if isinstance(store, BaseStore) or store is None:
-                limit: AnyRateLimit = RateLimit(rate, store)
+            if async_store:
+                limit: AnyRateLimit = RateLimit(rate, store) # type: ignore[arg-type]
             else:
                 raise TypeError("Cannot use a uprate._sync.SyncStore instance with a coroutine function.")
 
-            @wraps(func)
-            async def rated(*args, **kwargs):
-                while True:
-                    try:
-                        bucket = await maybe_awaitable(key(*args, **kwargs))
-                        await limit.acquire(bucket)
-                    except RateLimitError as err:
-                        if on_retry is None:
-                            raise err from None
-                        else:
-                            await maybe_awaitable(on_retry(err))
-                    else:
+            aacquire = limit.acquire
+            atry_acquire = limit.try_acquire
+
+            # Retrying is the slow path, so both kinds of on_retry
+            # are awaited through the same coroutine function.
+            if on_retry is None:
+                aon_retry = None
+            elif on_retry is on_retry_sleep:
+                aon_retry = _sleep_for
+            elif iscoroutinefunction(on_retry):
+                coro_on_retry = on_retry
+
+                async def aon_retry(retry: float, violated: Rate) -> None:
+                    await coro_on_retry(RateLimitError(retry + unix(), violated, retry_after=retry))
+            else:
+                plain_on_retry = on_retry
+
+                async def aon_retry(retry: float, violated: Rate) -> None:
+                    # Callables which aren't coroutine functions can still return
+                    # an awaitable, like objects with an async __call__.
+                    ret = plain_on_retry(RateLimitError(retry + unix(), violated, retry_after=retry))
+                    if hasattr(ret, "__await__"):
+                        await ret
+
+            if key is None:
+                if aon_retry is None:
+                    @wraps(func)
+                    async def rated(*args, **kwargs):
+                        await aacquire(bucket)
+                        return await func(*args, **kwargs)
+                else:
+                    @wraps(func)
+                    async def rated(*args, **kwargs):
+                        while True:
+                            res, retry, violated = await atry_acquire(bucket)
+                            if res:
+                                return await func(*args, **kwargs)
+
+                            await aon_retry(retry, violated)
+            elif iscoroutinefunction(key):
+                akey = cast(Callable[..., Coroutine[Any, Any, Key]], key)
+
+                if aon_retry is None:
+                    @wraps(func)
+                    async def rated(*args, **kwargs):
+                        await aacquire(await akey(*args, **kwargs))
                         return await func(*args, **kwargs)
+                else:
+                    @wraps(func)
+                    async def rated(*args, **kwargs):
+                        while True:
+                            res, retry, violated = await atry_acquire(await akey(*args, **kwargs))
+                            if res:
+                                return await func(*args, **kwargs)
+
+                            await aon_retry(retry, violated)
+            else:
+                # Keys which aren't coroutine functions can still return
+                # an awaitable, like lambdas calling a coroutine function.
+                skey = cast(Callable[..., Any], key)
+
+                if aon_retry is None:
+                    @wraps(func)
+                    async def rated(*args, **kwargs):
+                        bkt = skey(*args, **kwargs)
+                        if hasattr(bkt, "__await__"):
+                            bkt = await bkt
+
+                        await aacquire(bkt)
+                        return await func(*args, **kwargs)
+                else:
+                    @wraps(func)
+                    async def rated(*args, **kwargs):
+                        while True:
+                            bkt = skey(*args, **kwargs)
+                            if hasattr(bkt, "__await__"):
+                                bkt = await bkt
+
+                            res, retry, violated = await atry_acquire(bkt)
+                            if res:
+                                return await func(*args, **kwargs)
+
+                            await aon_retry(retry, violated)
         else:
-            if isinstance(store, SyncStore) or store is None:
-                limit = SyncRateLimit(rate, store)
+            if sync_store:
+                limit = SyncRateLimit(rate, store) # type: ignore[arg-type]
             else:
                 raise TypeError("Cannot use a uprate.BaseStore instance with a subroutine.")
 
-            @wraps(func)
-            def rated(*args, **kwargs):
-                while True:
-                    try:
-                        bucket = key(*args, **kwargs)
-                        limit.acquire(bucket)
-                    except RateLimitError as err:
-                        if on_retry is None:
-                            raise err from None
-                        else:
-                            on_retry(err)
-                    else:
-                        return func()
-
-        return _apply_attrs(rated, limit=limit)
+            acquire = limit.acquire
+            try_acquire = limit.try_acquire
+
+            sync_on_retry: Optional[Callable[[float, Rate], None]]
+            if on_retry is None:
+                sync_on_retry = None
+            elif on_retry is on_retry_block:
+                sync_on_retry = _block_for
+            else:
+                user_on_retry = on_retry
+
+                def call_on_retry(retry: float, violated: Rate) -> None:
+                    user_on_retry(RateLimitError(retry + unix(), violated, retry_after=retry))
+
+                sync_on_retry = call_on_retry
+
+            if sync_on_retry is None:
+                if key is None:
+                    @wraps(func)
+                    def rated(*args, **kwargs):
+                        acquire(bucket)
+                        return func(*args, **kwargs)
+                else:
+                    @wraps(func)
+                    def rated(*args, **kwargs):
+                        acquire(key(*args, **kwargs))
+                        return func(*args, **kwargs)
+            else:
+                if key is None:
+                    @wraps(func)
+                    def rated(*args, **kwargs):
+                        while True:
+                            res, retry, violated = try_acquire(bucket)
+                            if res:
+                                return func(*args, **kwargs)
+
+                            sync_on_retry(retry, violated)
+                else:
+                    @wraps(func)
+                    def rated(*args, **kwargs):
+                        while True:
+                            res, retry, violated = try_acquire(key(*args, **kwargs))
+                            if res:
+                                return func(*args, **kwargs)
+
+                            sync_on_retry(retry, violated)
+
+        limited = cast("LimitedCallable[R]", rated)
+        limited.limit = limit
+        return limited
 
     return decorator
 
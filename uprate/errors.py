@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from math import ceil
 from typing import TYPE_CHECKING
 from time import time as now
 
@@ -20,22 +21,36 @@ class RateLimitError(Exception):
     ----------
     retry_at : :class:`float`
         The unix timestamp of when to retry.
+    retry_after : :class:`float`
+        The amount of time to retry after in seconds, as of when
+        the error was created. Use :attr:`.RateLimitError.retry_at`
+        to account for the time elapsed since.
     rate : :class:`~uprate.rate.Rate`
         The rate that was violated
     """
+    __slots__ = ("retry_at", "retry_after", "rate")
+
     retry_at: float
+    retry_after: float
     rate: Rate
 
-    @property
-    def retry_after(self) -> float:
-        """:class:`float` : The amount of time to retry after in seconds, might be negative if enough time has elapsed"""
-        return self.retry_at - now()
-
-    def __init__(self, retry_at: float, rate: Rate, *args):
+    def __init__(self, retry_at: float, rate: Rate, *args, retry_after: float | None = None):
+        # BaseException.__new__ stores every positional argument
+        # in args, this must be called to leave only the message args.
         super().__init__(*args)
         self.retry_at = retry_at
+        # Computed once, instead of reading the clock on every access.
+        # Raisers that already know it pass it in to skip the clock read.
+        self.retry_after = retry_at - now() if retry_after is None else retry_after
         self.rate = rate
 
+    def __reduce__(self):
+        # The slotted attributes aren't part of the instance __dict__
+        # which BaseException.__reduce__ relies on.
+        # retry_after goes in the state, so that it isn't recomputed
+        # from the clock when the error is unpickled or copied.
+        return self.__class__, (self.retry_at, self.rate, *self.args), {"retry_after": self.retry_after}
+
     def __float__(self) -> float:
         """Return :attr:`.RateLimitError.retry_after` as a float
 
@@ -54,4 +69,4 @@ class RateLimitError(Exception):
         int
             The ceiled amount of seconds to retry after
         """
-        return self.retry_after.__int__() + 1
+        return ceil(self.retry_after)
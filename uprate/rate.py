@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import ClassVar, Union
+from weakref import WeakValueDictionary
 
 __all__ = (
     "Rate",
@@ -21,11 +22,13 @@ class RateGroup:
         self._data = []
 
     def __or__(self, other) -> RateGroup:
+        # Mutates and returns self, so chains like
+        # ``a | b | c | d`` build a single group in place.
         if isinstance(other, Rate):
             self._data.append(other)
             return self
         elif isinstance(other, self.__class__):
-            self._data = self._data + other._data
+            self._data.extend(other._data)
             return self
         return NotImplemented
 
@@ -44,6 +47,9 @@ class Rate:
     You should refrain from creating your own Rate objects
     and instead use the objects provided in the library.
 
+    Rate objects are interned, equal rates may be the same object,
+    hence they must not be mutated.
+
     Attributes
     ----------
     uses: int
@@ -51,14 +57,31 @@ class Rate:
     period: float
         The time period of the rate in seconds
     """
-    __slots__ = ("uses", "period")
+    __slots__ = ("uses", "period", "_hash", "__weakref__")
 
     uses: int
     period: float
+    _hash: int
+
+    # Rates are interned, expressions like ``2 * Minutes`` tend to
+    # repeat and equal rates can then be compared by identity.
+    _interned: ClassVar[WeakValueDictionary[tuple[type[Rate], int, float], Rate]] = WeakValueDictionary()
+
+    def __new__(cls, uses: int, period: float) -> Rate:
+        key = (cls, uses, period)
+        self = cls._interned.get(key)
+
+        if self is None:
+            self = super().__new__(cls)
+            self.uses = uses
+            self.period = period
+            self._hash = hash((uses, period))
+            cls._interned[key] = self
+
+        return self
 
-    def __init__(self, uses: int, period: float) -> None:
-        self.uses = uses
-        self.period = period
+    def __getnewargs__(self) -> tuple[int, float]:
+        return self.uses, self.period
 
     def __call__(self, magnitude: float) -> Rate:
         return self.__class__(self.uses, self.period * magnitude)
@@ -101,6 +124,8 @@ class Rate:
     # object has other as object
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if isinstance(other, self.__class__):
             return self.period == other.period and self.uses == other.uses
         return NotImplemented
@@ -112,7 +137,7 @@ class Rate:
 
     def __hash__(self) -> int:
         # This might be a bad idea
-        return hash((self.uses, self.period))
+        return self._hash
 
     def __str__(self) -> str:
         return f"{self.uses}/{self.period}"
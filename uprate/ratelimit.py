@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from operator import attrgetter
 from time import time as unix
-from typing import Generic, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Generic, Optional, TypeVar, Union
 
 from uprate.store import BaseStore, MemoryStore
 
 from .errors import RateLimitError
 from .rate import Rate, RateGroup
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 __all__ = (
     "RateLimit",
 )
@@ -44,6 +47,7 @@ class RateLimit(Generic[H]):
     """
     rates: tuple[Rate, ...]
     store: BaseStore[H]
+    _direct: Optional[MemoryStore[H]]
 
     def __init__(self, rate: Union[Rate, RateGroup], store: Optional[BaseStore[H]] = None) -> None:
         if isinstance(rate, Rate):
@@ -63,6 +67,15 @@ class RateLimit(Generic[H]):
 
         self.store.setup(self)
 
+        # MemoryStore.acquire never awaits, so call the method doing
+        # the work directly instead of creating a coroutine each time.
+        # Subclasses overriding acquire may await, those aren't bypassed.
+        # The method is looked up per call, setup may rebind it.
+        if isinstance(self.store, MemoryStore) and type(self.store).acquire is MemoryStore.acquire:
+            self._direct = self.store
+        else:
+            self._direct = None
+
     async def acquire(self, key: H) -> None:
         """Try to acquire a usage token for given token.
         Raise an error if token can't be acquired.
@@ -77,14 +90,53 @@ class RateLimit(Generic[H]):
         :exc:`~uprate.errors.RateLimitError`
             Cannot acquire usage token due to exhaustion.
         """
-        res, retry, rate = await self.store.acquire(key)
+        if self._direct is None:
+            res, retry, rate = await self.store.acquire(key)
+        else:
+            res, retry, rate = self._direct._acquire_sync(key)
 
         if not res:
             # cast is ugly, overloads don't work (parameters don't change)
             # TODO: https://www.python.org/dev/peps/pep-0647/
-            raise RateLimitError(retry_at=retry + unix(), rate=rate) # type: ignore[arg-type]
+            raise RateLimitError(retry + unix(), rate, retry_after=retry) # type: ignore[arg-type]
+
+    async def try_acquire(self, key: H) -> tuple[bool, float, Optional[Rate]]:
+        """Try to acquire a usage token for given key without raising
+        an error on failure. Useful when failing to acquire is expected
+        and handled in a loop, since exceptions are expensive.
+
+        Parameters
+        ----------
+        key : :data:`.H`
+            The key to acquire a usage token for.
+
+        Returns
+        -------
+        tuple[:class:`bool`, :class:`float`, :class:`~uprate.rate.Rate` | :data:`None`]
+            Same as the return value of :meth:`uprate.store.BaseStore.acquire`
+        """
+        if self._direct is None:
+            return await self.store.acquire(key)
+
+        return self._direct._acquire_sync(key)
+
+    async def try_acquire_many(self, keys: Iterable[H]) -> list[tuple[bool, float, Optional[Rate]]]:
+        """Same as :meth:`.RateLimit.try_acquire` but for many keys at once,
+        which saves the per call overhead when checking a batch of keys.
+
+        Parameters
+        ----------
+        keys : Iterable[:data:`.H`]
+            The keys to acquire a usage token for.
+
+        Returns
+        -------
+        list[tuple[:class:`bool`, :class:`float`, :class:`~uprate.rate.Rate` | :data:`None`]]
+            Same as the return value of :meth:`uprate.store.BaseStore.acquire_many`
+        """
+        return await self.store.acquire_many(keys)
 
-    async def reset(self, key: H = None) -> None:
+    async def reset(self, key: Optional[H] = None) -> None:
         """Reset the given key.
 
         Parameters
@@ -92,7 +144,7 @@ class RateLimit(Generic[H]):
         key : :data:`.H`, :data:`None`, (``H | None``)
             The key to reset ratelimit for. If :data:`None`, then resets all ratelimits, by default :data:`None`.
         """
-        if not key:
+        if key is None:
             await self.store.clear()
         else:
             await self.store.reset(key)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from abc import abstractmethod
-from collections.abc import Hashable
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
 from time import monotonic as _now
-from typing import (TYPE_CHECKING, Optional, Protocol, TypeVar,
-                    runtime_checkable)
+from typing import TYPE_CHECKING, Generic, Optional, TypeVar
 
 if TYPE_CHECKING:
     from .rate import Rate
@@ -21,12 +22,48 @@ T = TypeVar("T", contravariant=True)
 H = TypeVar("H", contravariant=True, bound=Hashable)
 """A contravariant TypeVar bound to :class:`collections.abc.Hashable`"""
 
-@runtime_checkable
-class BaseStore(Protocol[T]):
-    """A protocol defining the design of async stores.
+def _acquire_record(
+    record: array[float],
+    rate_params: tuple[tuple[int, int, float, Rate], ...],
+    now: float
+) -> tuple[bool, float, Optional[Rate]]:
+    # The arithmetic of acquiring a usage token for an existing
+    # record, shared by MemoryStore and SyncMemoryStore.
+    # A rate with no tokens whose period hasn't expired has a positive
+    # retry time, so a worst of 0.0 means that nothing is blocking.
+    worst = 0.0
+    worst_rate: Optional[Rate] = None
+
+    # Check every rate before touching the record, so that
+    # a rejected acquire doesn't spend tokens of other rates.
+    for i, _, period, rate in rate_params:
+        if record[i] == 0 and (retry := (record[i + 1] + period - now)) > worst:
+            worst = retry
+            worst_rate = rate
+
+    if worst > 0.0:
+        return False, worst, worst_rate
+
+    # Optimisations: We do not need to update every rate
+    # that expires only the ones that don't have usage tokens.
+    for i, uses, _, _ in rate_params:
+        if record[i] == 0:
+            # We have no tokens left but the rate has expired
+            # so we reset it and acquire a token.
+            record[i] = uses - 1
+            record[i + 1] = now
+        else:
+            record[i] -= 1
+
+    return True, 0.0, None
+
+class BaseStore(ABC, Generic[T]):
+    """An abstract base class defining the design of async stores.
     This is generic in TypeVar :data:`uprate.store.T` which is unbound and unconstrained.
 
-    Subclasses implementing this protocol should inherit from this class.
+    Stores must inherit from this class, or be registered as a virtual
+    subclass with :meth:`~abc.ABCMeta.register`. Structurally matching
+    classes are no longer accepted on their own.
 
     Attributes
     ----------
@@ -87,6 +124,23 @@ class BaseStore(Protocol[T]):
         """
         ...
 
+    async def acquire_many(self, keys: Iterable[T]) -> list[tuple[bool, float, Optional[Rate]]]:
+        """Try to acquire a usage token for each of the given keys.
+        The default implementation awaits :meth:`.BaseStore.acquire` per key,
+        stores which can do better in bulk should override this.
+
+        Parameters
+        ----------
+        keys : Iterable[:data:`uprate.store.T`]
+            The keys to acquire a ratelimit for.
+
+        Returns
+        -------
+        list[tuple[:class:`bool`, :class:`float`, :class:`~uprate.rate.Rate` | :data:`None`]]
+            The results of :meth:`.BaseStore.acquire`, in the same order as the keys.
+        """
+        return [await self.acquire(key) for key in keys]
+
     @abstractmethod
     async def reset(self, key: T) -> None:
         """Reset the usage tokens for given key.
@@ -105,82 +159,137 @@ class BaseStore(Protocol[T]):
         """
         ...
 
-class MemoryStore(BaseStore[H]):
-    """An implementation of :class:`.BaseStore` protocol.
-    This implementation uses :class:`dict` and ejects stale buckets/keys
-    periodically only when :meth:`.MemoryStore.acquire` is called.
-
-    This is a generic in TypeVar :data:`.H`
-
-    Attributes
-    ----------
-    limit : :class:`uprate.ratelimit.RateLimit`
-        The RateLimit to which this store is bound to.
-    """
-    _data: dict[H, tuple[list[int | float], ...]]
+class _MemoryRecords(Generic[H]):
+    # The record keeping shared by MemoryStore and SyncMemoryStore,
+    # which only differ in whether their public methods are coroutines.
+    _data: OrderedDict[H, array[float]]
+    _rate_params: tuple[tuple[int, int, float, Rate], ...]
+    _initial: array[float]
+    _max_period: float
+    _last_verified: float
 
     def __init__(self):
-        self._data = {}
+        self._data = OrderedDict()
         self._last_verified = 0.0
 
-    def setup(self, ratelimit: RateLimit):
-        super().setup(ratelimit)
-        self._max_period = self.limit.rates[-1].period
-
-    async def acquire(self, key: H) -> tuple[bool, float, Optional[Rate]]:
+    def _setup_records(self, rates: tuple[Rate, ...]) -> None:
+        self._max_period = rates[-1].period
+        # Rates do not change once bound, so avoid
+        # attribute lookups on them in acquire.
+        # The first element is the offset of the rate's
+        # usage tokens in a record.
+        self._rate_params = tuple((2 * n, i.uses, i.period, i) for n, i in enumerate(rates))
+        # Template for new records, only the last resets need to be filled in.
+        self._initial = array("d", [j for i in rates for j in (i.uses - 1, 0.0)])
+
+        # Most limits enforce a single rate, which doesn't need a loop.
+        # Always rebound, since a store may be set up again for other rates.
+        self._acquire_sync: Callable[[H], tuple[bool, float, Optional[Rate]]] = (
+            self._acquire_single if len(self._rate_params) == 1 else self._acquire_multi
+        )
+
+    def _acquire_multi(self, key: H) -> tuple[bool, float, Optional[Rate]]:
         now = _now()
         # Would using loop.call_at be a better idea?
         # or per key scheduled callback maybe?
-        self.verify_cache() # Evict stale keys
-        record = self._data.get(key, None)
+        if (now - self._last_verified) >= self._max_period:
+            self.verify_cache(now) # Evict stale keys
 
-        if record is None:
+        try:
+            record = self._data[key]
+        except KeyError:
             # 1st insert
-            self._data[key] = tuple([i.uses - 1, now] for i in self.limit.rates)
+            # A record is a flat array of [tokens, last reset] pairs, one per rate.
+            record = self._initial[:]
+            record[1::2] = array("d", (now,)) * len(self._rate_params)
+            self._data[key] = record
             return True, 0.0, None
-        else:
-            worst: float = False
-            worst_rate: Optional[Rate] = None
-
-            # Optimisations: We do not need to update every rate
-            # that expires only the ones that don't have usage tokens.
-            for use_dt, rate in zip(record, self.limit.rates):
-                if use_dt[0] == 0:
-                    if (then := (use_dt[1] + rate.period)) <= now:
-                        # We have no tokens left but the rate has expired
-                        # so we reset it and acquire a token.
-                        use_dt[:] = [rate.uses - 1, now]
-                    elif (retry := then - now) > worst:
-                        # no tokens and the rate has time left to expire.
-                        worst = retry
-                        worst_rate = rate
-                else:
-                    use_dt[0] -= 1
-            if worst is False:
-                return True, 0.0, None
-
-            return False, worst, worst_rate
 
-    async def reset(self, key: H) -> None:
-        del self._data[key]
+        last = record[-1]
+        res = _acquire_record(record, self._rate_params, now)
 
-    async def clear(self) -> None:
-        self._data.clear()
+        if record[-1] != last:
+            # The longest rate was reset, keep the records ordered by it.
+            self._data.move_to_end(key)
+
+        return res
 
-    def verify_cache(self) -> None:
+    def _acquire_single(self, key: H) -> tuple[bool, float, Optional[Rate]]:
+        now = _now()
+        if (now - self._last_verified) >= self._max_period:
+            self.verify_cache(now) # Evict stale keys
+
+        _, uses, period, rate = self._rate_params[0]
+
+        try:
+            record = self._data[key]
+        except KeyError:
+            # 1st insert
+            self._data[key] = array("d", (uses - 1, now))
+            return True, 0.0, None
+
+        if record[0] != 0:
+            record[0] -= 1
+        elif (then := (record[1] + period)) <= now:
+            record[0] = uses - 1
+            record[1] = now
+            self._data.move_to_end(key)
+        else:
+            return False, then - now, rate
+
+        return True, 0.0, None
+
+    def verify_cache(self, now: float) -> None:
         # There is no way something has expired since the last
         # check if enough time hasn't passed.
-        now = _now()
         if (now - self._last_verified) < self._max_period:
             return
 
-        delete = list[H]()
+        # Records are kept ordered by the last reset of their longest rate
+        # (the last element) so the stale ones are always at the front.
+        data = self._data
+        max_period = self._max_period
+        while data:
+            key = next(iter(data))
+            if (now - data[key][-1]) <= max_period:
+                break
+
+            del data[key]
+
+        self._last_verified = now
+
+class MemoryStore(_MemoryRecords[H], BaseStore[H]):
+    """An implementation of :class:`.BaseStore`.
+    This implementation uses :class:`~collections.OrderedDict` and ejects stale buckets/keys
+    periodically only when :meth:`.MemoryStore.acquire` is called.
+
+    This is a generic in TypeVar :data:`.H`
+
+    Attributes
+    ----------
+    limit : :class:`uprate.ratelimit.RateLimit`
+        The RateLimit to which this store is bound to.
+    """
+    def setup(self, ratelimit: RateLimit):
+        super().setup(ratelimit)
+        self._setup_records(self.limit.rates)
 
-        for k, v in self._data.items():
-            if self._max_period < (now - v[-1][1]):
-                delete.append(k)
+    async def acquire(self, key: H) -> tuple[bool, float, Optional[Rate]]:
+        # Nothing here awaits, the work is done in a plain
+        # method which callers in the loop can use directly.
+        return self._acquire_sync(key)
+
+    async def acquire_many(self, keys: Iterable[H]) -> list[tuple[bool, float, Optional[Rate]]]:
+        # An overridden acquire may await, so it must be called per key.
+        if type(self).acquire is not MemoryStore.acquire:
+            return await super().acquire_many(keys)
 
-        for i in delete:
-            del self._data[i]
+        # One coroutine for all the keys instead of one each.
+        acquire = self._acquire_sync
+        return [acquire(key) for key in keys]
 
-        self._last_verified = _now()
+    async def reset(self, key: H) -> None:
+        del self._data[key]
+
+    async def clear(self) -> None:
+        self._data.clear()